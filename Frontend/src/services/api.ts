@@ -1,5 +1,5 @@
 import axios from 'axios'
-import type { InsightsResponse, UploadResponse } from '../types'
+import type { InsightsResponse, SectionDiffResponse, UploadResponse } from '../types'
 
 export interface WordCount { word: string; count: number }
 export interface DocumentItemUI {
@@ -34,6 +34,11 @@ export async function fetchInsights(limit = 10, offset = 0): Promise<InsightsRes
 	return data
 }
 
+export async function fetchDocumentDiff(id: number, against?: number): Promise<SectionDiffResponse> {
+	const { data } = await axios.get(`${API_BASE}/documents/${id}/diff`, { params: { against } })
+	return data
+}
+
 // New helper shaping to UI Document
 export async function uploadDocument(file: File): Promise<UploadResult> {
 	try {
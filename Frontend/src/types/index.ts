@@ -9,6 +9,9 @@ export interface DocumentItem {
 	ai_summary?: string;
 	upload_date: string;
 	file_size: number;
+	page_count?: number;
+	pages_truncated: boolean;
+	text_truncated: boolean;
 }
 
 export interface UploadResponse {
@@ -17,6 +20,11 @@ export interface UploadResponse {
 	ai_summary?: string;
 	fallback_words?: WordCount[];
 	status: string;
+	previous_id?: number;
+	reused_sections: number;
+	page_count?: number;
+	pages_truncated: boolean;
+	text_truncated: boolean;
 }
 
 export interface InsightsResponse {
@@ -24,4 +32,15 @@ export interface InsightsResponse {
 	total: number;
 }
 
+export interface SectionDiffItem {
+	title: string;
+	status: 'unchanged' | 'changed' | 'added' | 'removed';
+	summary?: string;
+}
 
+export interface SectionDiffResponse {
+	document_id: number;
+	previous_id?: number;
+	sections: SectionDiffItem[];
+	removed: SectionDiffItem[];
+}
@@ -1,7 +1,8 @@
+import hashlib
 import json
 import re
 from collections import Counter
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import requests
 from decouple import config
@@ -235,28 +236,65 @@ def _split_into_sections(text: str) -> List[Tuple[str, str]]:
 
 	# Fallback if we only got one big section
 	if len(sections) <= 1:
-		# Split by sentences into chunks to ensure coverage
-		sentences = re.split(r"(?<=[.!?])\s+", text)
-		chunk_size = 10
+		# Split by sentences into chunks to ensure coverage. Chunk ends are picked
+		# from the sentence text rather than fixed counts, so inserting a sentence
+		# only changes the chunk it lands in and later chunks keep their fingerprints.
+		sentences = [s for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()]
 		chunks: List[Tuple[str, str]] = []
-		for i in range(0, len(sentences), chunk_size):
-			chunk_sentences = sentences[i:i+chunk_size]
-			if chunk_sentences:
-				title = f"Section {i//chunk_size + 1}"
-				chunks.append((title, " ".join(chunk_sentences)))
+		chunk_sentences: List[str] = []
+		for sentence in sentences:
+			chunk_sentences.append(sentence)
+			if len(chunk_sentences) >= CHUNK_MAX_SENTENCES or (
+				len(chunk_sentences) >= CHUNK_MIN_SENTENCES and _is_chunk_boundary(sentence)
+			):
+				chunks.append((f"Section {len(chunks) + 1}", " ".join(chunk_sentences)))
+				chunk_sentences = []
+		if chunk_sentences:
+			chunks.append((f"Section {len(chunks) + 1}", " ".join(chunk_sentences)))
 		return chunks
 
 	return sections
 
 
-def summarize_sections(text: str, max_sections: int = 8, per_summary_sentences: int = 3) -> List[Tuple[str, str]]:
-	sections = _split_into_sections(text)
+CHUNK_MIN_SENTENCES = 3
+CHUNK_MAX_SENTENCES = 25
+CHUNK_BOUNDARY_MODULUS = 8
+
+
+def _is_chunk_boundary(sentence: str) -> bool:
+	digest = hashlib.md5(" ".join(sentence.split()).encode("utf-8")).hexdigest()
+	return int(digest, 16) % CHUNK_BOUNDARY_MODULUS == 0
+
+
+def is_generic_section_title(title: str) -> bool:
+	# "Section N" titles come from the sentence-chunk fallback and carry no meaning across revisions
+	return bool(re.match(r"^Section \d+$", title))
+
+
+def section_fingerprint(content: str) -> str:
+	# Whitespace-insensitive so re-flowed PDF text of an unchanged section still matches
+	normalized = " ".join(content.split())
+	return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def split_fingerprinted_sections(text: str) -> List[Tuple[str, str, str]]:
+	"""
+	Return (title, content, fingerprint) for every section produced by
+	_split_into_sections, in document order.
+	"""
+	return [(title, content, section_fingerprint(content)) for title, content in _split_into_sections(text)]
+
+
+def sample_sections(items: List[Tuple[str, str]], max_sections: int = 8) -> List[Tuple[str, str]]:
 	# Evenly sample across the document to avoid bias to early sections
-	if len(sections) > max_sections:
-		indices = [round(i * (len(sections) - 1) / (max_sections - 1)) for i in range(max_sections)]
-		picked = [sections[i] for i in indices]
-	else:
-		picked = sections
+	if len(items) > max_sections:
+		indices = [round(i * (len(items) - 1) / (max_sections - 1)) for i in range(max_sections)]
+		return [items[i] for i in indices]
+	return items
+
+
+def summarize_sections(text: str, max_sections: int = 8, per_summary_sentences: int = 3) -> List[Tuple[str, str]]:
+	picked = sample_sections(_split_into_sections(text), max_sections=max_sections)
 	results: List[Tuple[str, str]] = []
 	for title, content in picked:
 		summary = summarize_extractive(content, max_sentences=per_summary_sentences)
@@ -264,6 +302,33 @@ def summarize_sections(text: str, max_sections: int = 8, per_summary_sentences:
 	return results
 
 
+def summarize_fingerprinted_sections(
+	sections: List[Tuple[str, str, str]],
+	cache: Dict[str, str],
+	per_summary_sentences: int = 2,
+) -> Tuple[List[str], int]:
+	"""
+	Summarize every section, reusing summaries from cache (fingerprint -> summary,
+	taken from a previous revision). Returns the summaries in section order and
+	the number of cache hits; repeated sections within this document are only
+	summarized once but do not count as hits.
+	"""
+	computed: Dict[str, str] = {}
+	summaries: List[str] = []
+	hits = 0
+	for _, content, fingerprint in sections:
+		if fingerprint in cache:
+			summary = cache[fingerprint]
+			hits += 1
+		elif fingerprint in computed:
+			summary = computed[fingerprint]
+		else:
+			summary = summarize_extractive(content, max_sentences=per_summary_sentences)
+			computed[fingerprint] = summary
+		summaries.append(summary)
+	return summaries, hits
+
+
 def build_overall_summary(text: str, section_summaries: List[Tuple[str, str]], max_sentences: int = 6) -> str:
 	# Second-pass summary over concatenated section summaries to cover breadth
 	combined = "\n".join(s for _, s in section_summaries if s)
@@ -366,13 +431,15 @@ def extract_key_topics(text: str, top_n: int = 8) -> List[str]:
 	return [p for p, _ in ranked[:top_n]]
 
 
-def generate_generic_insight_report(text: str) -> Optional[str]:
+def generate_generic_insight_report(text: str, section_summaries: Optional[List[Tuple[str, str]]] = None) -> Optional[str]:
 	if not text or len(text) < 20:
 		return None
 	doc_type = detect_document_type(text)
 	keywords_list = extract_key_topics(text, top_n=8)
-	# Two-pass: per-section, then overall
-	sec_summaries = summarize_sections(text, max_sections=8, per_summary_sentences=2)
+	# Two-pass: per-section (callers may pass sampled pieces built from a revision cache), then overall
+	sec_summaries = section_summaries
+	if sec_summaries is None:
+		sec_summaries = summarize_sections(text, max_sections=8, per_summary_sentences=2)
 	summary = build_overall_summary(text, sec_summaries, max_sentences=6)
 	outline = extract_outline_headings(text)
 	entities = extract_entities_basic(text)
@@ -20,10 +20,41 @@ def initialize_database() -> None:
 			fallback_words TEXT,
 			processing_status TEXT DEFAULT 'completed',
 			upload_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-			file_size INTEGER
+			file_size INTEGER,
+			page_count INTEGER,
+			pages_truncated INTEGER DEFAULT 0,
+			text_truncated INTEGER DEFAULT 0
 		);
 		"""
 	)
+	# Databases created before the extraction ceilings lack these columns
+	cursor.execute("PRAGMA table_info(documents)")
+	existing = {row[1] for row in cursor.fetchall()}
+	for column, definition in (
+		("page_count", "INTEGER"),
+		("pages_truncated", "INTEGER DEFAULT 0"),
+		("text_truncated", "INTEGER DEFAULT 0"),
+	):
+		if column not in existing:
+			cursor.execute(f"ALTER TABLE documents ADD COLUMN {column} {definition}")
+	cursor.execute(
+		"""
+		CREATE TABLE IF NOT EXISTS document_sections (
+			id INTEGER PRIMARY KEY AUTOINCREMENT,
+			document_id INTEGER NOT NULL,
+			position INTEGER NOT NULL,
+			title TEXT NOT NULL,
+			content_hash TEXT NOT NULL,
+			summary TEXT
+		);
+		"""
+	)
+	cursor.execute(
+		"CREATE INDEX IF NOT EXISTS idx_document_sections_document_id ON document_sections (document_id);"
+	)
+	cursor.execute(
+		"CREATE INDEX IF NOT EXISTS idx_documents_original_name ON documents (original_name);"
+	)
 	connection.commit()
 	connection.close()
 
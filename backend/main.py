@@ -2,7 +2,7 @@ import json
 import os
 import time
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from fastapi import FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,13 +10,17 @@ from fastapi.responses import JSONResponse
 from decouple import config
 
 from database import get_db_connection, initialize_database
-from models import DocumentItem, InsightsResponse, UploadResponse
-from pdf_processor import extract_text_from_pdf
+from models import DocumentItem, InsightsResponse, SectionDiffItem, SectionDiffResponse, UploadResponse
+from pdf_processor import extract_pdf_text
 from ai_service import (
 	call_sarvam_ai_summary,
 	fallback_top_words,
 	generate_structured_report,
 	generate_generic_insight_report,
+	is_generic_section_title,
+	sample_sections,
+	split_fingerprinted_sections,
+	summarize_fingerprinted_sections,
 )
 
 
@@ -27,6 +31,13 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 # Environment variables
 ALLOWED_ORIGINS = config("ALLOWED_ORIGINS", default="http://localhost:3000,http://localhost:5173").split(",")
 MAX_FILE_SIZE = config("MAX_FILE_SIZE", default=10 * 1024 * 1024, cast=int)
+MAX_PDF_PAGES = config("MAX_PDF_PAGES", default=300, cast=int)
+MAX_TEXT_CHARS = config("MAX_TEXT_CHARS", default=500_000, cast=int)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+for _name, _value in (("MAX_PDF_PAGES", MAX_PDF_PAGES), ("MAX_TEXT_CHARS", MAX_TEXT_CHARS)):
+	if _value < 1:
+		raise ValueError(f"{_name} must be at least 1, got {_value}")
 
 app = FastAPI(title="AI Document Insight Tool")
 
@@ -44,49 +55,151 @@ def on_startup():
 	initialize_database()
 
 
+def _find_previous_version(cursor, original_name: str, before_id: Optional[int] = None) -> Optional[int]:
+	# Revisions are matched by the name the user uploaded, newest first
+	if before_id is None:
+		cursor.execute(
+			"SELECT id FROM documents WHERE original_name = ? ORDER BY id DESC LIMIT 1",
+			(original_name,),
+		)
+	else:
+		cursor.execute(
+			"SELECT id FROM documents WHERE original_name = ? AND id < ? ORDER BY id DESC LIMIT 1",
+			(original_name, before_id),
+		)
+	row = cursor.fetchone()
+	return row[0] if row else None
+
+
+def _load_sections(cursor, doc_id: int) -> List[Tuple[str, str, Optional[str]]]:
+	cursor.execute(
+		"SELECT title, content_hash, summary FROM document_sections WHERE document_id = ? ORDER BY position",
+		(doc_id,),
+	)
+	return cursor.fetchall()
+
+
+def classify_section_diff(
+	current: List[Tuple[str, str, Optional[str]]],
+	previous: List[Tuple[str, str, Optional[str]]],
+) -> Tuple[List[SectionDiffItem], List[SectionDiffItem]]:
+	"""
+	Classify (title, content_hash, summary) rows of a document against an earlier
+	revision. A section is unchanged when its fingerprint exists in the previous
+	revision and changed when only its heading does; generic "Section N" titles
+	never pair sections up, so edited heading-less text shows as added/removed.
+	"""
+	previous_hashes = {content_hash for _, content_hash, _ in previous}
+	previous_titles = {title for title, _, _ in previous if not is_generic_section_title(title)}
+	current_hashes = {content_hash for _, content_hash, _ in current}
+	current_titles = {title for title, _, _ in current if not is_generic_section_title(title)}
+
+	sections: List[SectionDiffItem] = []
+	for title, content_hash, summary in current:
+		if content_hash in previous_hashes:
+			status = "unchanged"
+		elif title in previous_titles:
+			status = "changed"
+		else:
+			status = "added"
+		sections.append(SectionDiffItem(title=title, status=status, summary=summary))
+
+	removed = [
+		SectionDiffItem(title=title, status="removed", summary=summary)
+		for title, content_hash, summary in previous
+		if content_hash not in current_hashes and title not in current_titles
+	]
+	return sections, removed
+
+
 @app.post("/upload-resume", response_model=UploadResponse)
 async def upload_resume(file: UploadFile = File(...)):
 	if not file.filename.lower().endswith(".pdf"):
 		raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-	contents = await file.read()
-	file_size = len(contents)
-	if file_size > MAX_FILE_SIZE:
-		raise HTTPException(status_code=400, detail=f"File too large. Max {MAX_FILE_SIZE // (1024*1024)}MB")
+	too_large = HTTPException(status_code=400, detail=f"File too large. Max {MAX_FILE_SIZE // (1024*1024)}MB")
+	if file.size is not None and file.size > MAX_FILE_SIZE:
+		raise too_large
 
-	# Save file to disk with unique name
+	# Stream the spooled upload to disk with unique name, never holding the whole file in memory
 	unique_name = f"{int(time.time()*1000)}_{file.filename}"
 	saved_path = os.path.join(UPLOAD_DIR, unique_name)
+	file_size = 0
 	with open(saved_path, "wb") as f:
-		f.write(contents)
+		while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+			file_size += len(chunk)
+			if file_size > MAX_FILE_SIZE:
+				break
+			f.write(chunk)
+	if file_size > MAX_FILE_SIZE:
+		os.remove(saved_path)
+		raise too_large
 
-	# Extract text
-	text = extract_text_from_pdf(saved_path)
+	# Extract text (memory-mapped, bounded by page and character ceilings)
+	extraction = extract_pdf_text(saved_path, max_pages=MAX_PDF_PAGES, max_chars=MAX_TEXT_CHARS)
+	text = extraction.text
+	if not text and (extraction.pages_truncated or extraction.text_truncated):
+		raise HTTPException(
+			status_code=422,
+			detail=f"No extractable text within the first {MAX_PDF_PAGES} pages / {MAX_TEXT_CHARS} characters",
+		)
 	if not text:
 		raise HTTPException(status_code=422, detail="Unable to extract text from PDF")
 
-	# Call AI service with fallback
-	ai_summary: Optional[str] = call_sarvam_ai_summary(text)
+	# Split and fingerprint sections once; the previous upload of the same file is the revision base
+	sections = split_fingerprinted_sections(text)
+	fingerprints = [fingerprint for _, _, fingerprint in sections]
+	previous_sections: List[Tuple[str, str, Optional[str]]] = []
+	with get_db_connection() as conn:
+		cursor = conn.cursor()
+		previous_id = _find_previous_version(cursor, file.filename)
+		if previous_id is not None:
+			previous_sections = _load_sections(cursor, previous_id)
+			cursor.execute("SELECT ai_summary, fallback_words FROM documents WHERE id = ?", (previous_id,))
+			previous_result = cursor.fetchone()
+	previous_hashes = {content_hash for _, content_hash, _ in previous_sections}
+	shared = sum(1 for fingerprint in fingerprints if fingerprint in previous_hashes)
+	is_revision = bool(fingerprints) and shared * 2 >= len(fingerprints)
+
 	fallback_words = None
-	if not ai_summary:
-		# Try generic insight report for all documents
-		generic_report = generate_generic_insight_report(text)
-		ai_summary = generic_report or None
-		# If still nothing, try resume-structured heuristic
+	if previous_sections and fingerprints == [content_hash for _, content_hash, _ in previous_sections]:
+		# Identical sections: reuse the previous analysis without any summarization
+		ai_summary, stored_words = previous_result
+		fallback_words = json.loads(stored_words) if stored_words else None
+		summaries = [summary for _, _, summary in previous_sections]
+		reused_sections = len(sections)
+	else:
+		# Every section is summarized (reusing the previous revision's pieces) so the
+		# next revision and the diff view have a summary for each one
+		section_cache = {content_hash: summary for _, content_hash, summary in previous_sections if summary is not None}
+		summaries, reused_sections = summarize_fingerprinted_sections(sections, section_cache, per_summary_sentences=2)
+		sec_summaries = sample_sections([(title, summary) for (title, _, _), summary in zip(sections, summaries)], max_sections=8)
+
+		# Call AI service with fallback. Revisions that share most sections with the previous
+		# upload rebuild the overall summary from section pieces instead of re-summarizing remotely.
+		ai_summary: Optional[str] = None if is_revision else call_sarvam_ai_summary(text)
 		if not ai_summary:
-			structured = generate_structured_report(text)
-			ai_summary = structured or None
-			# If still nothing, provide simple keyword fallback
+			# Try generic insight report for all documents
+			generic_report = generate_generic_insight_report(text, section_summaries=sec_summaries)
+			ai_summary = generic_report or None
+			# If still nothing, try resume-structured heuristic
 			if not ai_summary:
-				fallback_words = fallback_top_words(text)
+				structured = generate_structured_report(text)
+				ai_summary = structured or None
+				# If still nothing, provide simple keyword fallback
+				if not ai_summary:
+					fallback_words = fallback_top_words(text)
 
 	# Persist to DB
 	with get_db_connection() as conn:
 		cursor = conn.cursor()
 		cursor.execute(
 			"""
-			INSERT INTO documents (filename, original_name, file_path, ai_summary, fallback_words, processing_status, file_size)
-			VALUES (?, ?, ?, ?, ?, ?, ?)
+			INSERT INTO documents (
+				filename, original_name, file_path, ai_summary, fallback_words, processing_status, file_size,
+				page_count, pages_truncated, text_truncated
+			)
+			VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 			""",
 			(
 				unique_name,
@@ -96,10 +209,23 @@ async def upload_resume(file: UploadFile = File(...)):
 				json.dumps(fallback_words) if fallback_words else None,
 				"completed",
 				file_size,
+				extraction.page_count,
+				int(extraction.pages_truncated),
+				int(extraction.text_truncated),
 			),
 		)
-		conn.commit()
 		new_id = cursor.lastrowid
+		cursor.executemany(
+			"""
+			INSERT INTO document_sections (document_id, position, title, content_hash, summary)
+			VALUES (?, ?, ?, ?, ?)
+			""",
+			[
+				(new_id, position, title, content_hash, summary)
+				for position, ((title, _, content_hash), summary) in enumerate(zip(sections, summaries))
+			],
+		)
+		conn.commit()
 
 	return UploadResponse(
 		id=new_id,
@@ -107,6 +233,11 @@ async def upload_resume(file: UploadFile = File(...)):
 		ai_summary=ai_summary,
 		fallback_words=fallback_words,
 		status="success",
+		previous_id=previous_id,
+		reused_sections=reused_sections,
+		page_count=extraction.page_count,
+		pages_truncated=extraction.pages_truncated,
+		text_truncated=extraction.text_truncated,
 	)
 
 
@@ -119,7 +250,7 @@ def get_insights(limit: int = 10, offset: int = 0):
 
 		cursor.execute(
 			"""
-			SELECT id, original_name, ai_summary, upload_date, file_size
+			SELECT id, original_name, ai_summary, upload_date, file_size, page_count, pages_truncated, text_truncated
 			FROM documents
 			ORDER BY upload_date DESC, id DESC
 			LIMIT ? OFFSET ?
@@ -135,6 +266,9 @@ def get_insights(limit: int = 10, offset: int = 0):
 				ai_summary=row[2],
 				upload_date=row[3],
 				file_size=row[4] or 0,
+				page_count=row[5],
+				pages_truncated=bool(row[6]),
+				text_truncated=bool(row[7]),
 			)
 			for row in rows
 		]
@@ -153,6 +287,7 @@ def delete_document(doc_id: int):
 		file_path = row[0]
 		# Delete DB row first
 		cursor.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+		cursor.execute("DELETE FROM document_sections WHERE document_id = ?", (doc_id,))
 		conn.commit()
 		# Try to remove file from disk
 		try:
@@ -163,3 +298,25 @@ def delete_document(doc_id: int):
 	return {"status": "deleted", "id": doc_id}
 
 
+@app.get("/documents/{doc_id}/diff", response_model=SectionDiffResponse)
+def diff_document(doc_id: int, against: Optional[int] = None):
+	with get_db_connection() as conn:
+		cursor = conn.cursor()
+		cursor.execute("SELECT original_name FROM documents WHERE id = ?", (doc_id,))
+		row = cursor.fetchone()
+		if not row:
+			raise HTTPException(status_code=404, detail="Document not found")
+
+		if against is None:
+			previous_id = _find_previous_version(cursor, row[0], before_id=doc_id)
+		else:
+			cursor.execute("SELECT id FROM documents WHERE id = ?", (against,))
+			if not cursor.fetchone():
+				raise HTTPException(status_code=404, detail="Comparison document not found")
+			previous_id = against
+
+		current = _load_sections(cursor, doc_id)
+		previous = _load_sections(cursor, previous_id) if previous_id is not None else []
+
+	sections, removed = classify_section_diff(current, previous)
+	return SectionDiffResponse(document_id=doc_id, previous_id=previous_id, sections=sections, removed=removed)
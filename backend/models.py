@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel
 
 
@@ -13,6 +13,11 @@ class UploadResponse(BaseModel):
 	ai_summary: Optional[str] = None
 	fallback_words: Optional[List[WordCount]] = None
 	status: str
+	previous_id: Optional[int] = None
+	reused_sections: int = 0
+	page_count: Optional[int] = None
+	pages_truncated: bool = False
+	text_truncated: bool = False
 
 
 class DocumentItem(BaseModel):
@@ -21,6 +26,9 @@ class DocumentItem(BaseModel):
 	ai_summary: Optional[str] = None
 	upload_date: str
 	file_size: int
+	page_count: Optional[int] = None
+	pages_truncated: bool = False
+	text_truncated: bool = False
 
 
 class InsightsResponse(BaseModel):
@@ -28,3 +36,14 @@ class InsightsResponse(BaseModel):
 	total: int
 
 
+class SectionDiffItem(BaseModel):
+	title: str
+	status: Literal["unchanged", "changed", "added", "removed"]
+	summary: Optional[str] = None
+
+
+class SectionDiffResponse(BaseModel):
+	document_id: int
+	previous_id: Optional[int] = None
+	sections: List[SectionDiffItem]
+	removed: List[SectionDiffItem]
@@ -1,15 +1,46 @@
-from typing import Optional
+import mmap
+import os
+from typing import NamedTuple, Optional
 from PyPDF2 import PdfReader
 
 
-def extract_text_from_pdf(file_path: str) -> Optional[str]:
-	try:
-		reader = PdfReader(file_path)
-		texts = []
-		for page in reader.pages:
-			texts.append(page.extract_text() or "")
-		return "\n".join(texts).strip()
-	except Exception:
-		return None
+class PdfExtraction(NamedTuple):
+	text: Optional[str]
+	page_count: int = 0
+	pages_truncated: bool = False
+	text_truncated: bool = False
 
 
+def extract_pdf_text(file_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> PdfExtraction:
+	"""
+	Extract text from a stored PDF without loading the whole file into memory.
+	The file is memory-mapped (PdfReader copies a path into a BytesIO otherwise),
+	and extraction stops at max_pages pages / max_chars characters, recording
+	whether either ceiling cut the document short. Only parse failures are
+	reported as unreadable input; OS and mmap errors propagate to the caller.
+	"""
+	with open(file_path, "rb") as fh:
+		# mmap cannot map an empty file; it is simply not a PDF
+		if os.fstat(fh.fileno()).st_size == 0:
+			return PdfExtraction(None)
+		with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+			try:
+				reader = PdfReader(mapped)
+				page_count = len(reader.pages)
+				pages_truncated = max_pages is not None and page_count > max_pages
+				text_truncated = False
+				texts = []
+				total = 0
+				for index, page in enumerate(reader.pages):
+					if max_pages is not None and index >= max_pages:
+						break
+					page_text = page.extract_text() or ""
+					if max_chars is not None and total + len(page_text) > max_chars:
+						texts.append(page_text[: max(0, max_chars - total)])
+						text_truncated = True
+						break
+					texts.append(page_text)
+					total += len(page_text) + 1
+				return PdfExtraction("\n".join(texts).strip(), page_count, pages_truncated, text_truncated)
+			except Exception:
+				return PdfExtraction(None)
@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import database  # noqa: E402
+import main  # noqa: E402
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+	TestClient = pytest.importorskip("fastapi.testclient").TestClient
+	monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "test.db"))
+	monkeypatch.setattr(main, "UPLOAD_DIR", str(tmp_path))
+	with TestClient(main.app) as test_client:
+		yield test_client
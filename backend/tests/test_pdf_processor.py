@@ -0,0 +1,51 @@
+import io
+
+import pytest
+from PyPDF2 import PdfWriter
+
+import main
+from pdf_processor import extract_pdf_text
+
+
+def _blank_pdf(pages):
+	writer = PdfWriter()
+	for _ in range(pages):
+		writer.add_blank_page(width=200, height=200)
+	buffer = io.BytesIO()
+	writer.write(buffer)
+	return buffer.getvalue()
+
+
+def test_page_ceiling_sets_flag(tmp_path):
+	path = tmp_path / "blank.pdf"
+	path.write_bytes(_blank_pdf(3))
+
+	extraction = extract_pdf_text(str(path), max_pages=2)
+
+	assert extraction.page_count == 3
+	assert extraction.pages_truncated
+	assert not extraction.text_truncated
+
+
+def test_unparseable_and_empty_files_have_no_text(tmp_path):
+	garbage = tmp_path / "garbage.pdf"
+	garbage.write_bytes(b"not a pdf at all")
+	empty = tmp_path / "empty.pdf"
+	empty.write_bytes(b"")
+
+	assert extract_pdf_text(str(garbage)).text is None
+	assert extract_pdf_text(str(empty)).text is None
+
+
+def test_os_errors_propagate(tmp_path):
+	with pytest.raises(FileNotFoundError):
+		extract_pdf_text(str(tmp_path / "missing.pdf"))
+
+
+def test_truncation_without_text_is_reported(client, monkeypatch):
+	monkeypatch.setattr(main, "MAX_PDF_PAGES", 1)
+
+	response = client.post("/upload-resume", files={"file": ("blank.pdf", _blank_pdf(2), "application/pdf")})
+
+	assert response.status_code == 422
+	assert response.json()["detail"].startswith("No extractable text within the first 1 pages")
@@ -0,0 +1,91 @@
+import pytest
+
+import database
+import main
+from pdf_processor import PdfExtraction
+
+
+SECTIONS = {
+	"EDUCATION": "B.Tech in Computer Science. Graduated with distinction in 2024.",
+	"EXPERIENCE": "Built data pipelines at a startup. Reduced report latency by half.",
+	"PROJECTS": "Document insight tool with FastAPI. Resume parser with heuristics.",
+}
+
+
+def _text(sections):
+	return "\n".join(f"{title}\n{body}" for title, body in sections.items())
+
+
+@pytest.fixture
+def remote_calls(monkeypatch):
+	calls = []
+
+	def fake_remote(text):
+		calls.append(text)
+		return "remote summary"
+
+	monkeypatch.setattr(main, "call_sarvam_ai_summary", fake_remote)
+	return calls
+
+
+def _upload(client, monkeypatch, text, name="cv.pdf"):
+	monkeypatch.setattr(main, "extract_pdf_text", lambda *args, **kwargs: PdfExtraction(text, 1))
+	response = client.post("/upload-resume", files={"file": (name, b"%PDF-1.4", "application/pdf")})
+	assert response.status_code == 200
+	return response.json()
+
+
+def test_identical_revision_reuses_previous_analysis(client, monkeypatch, remote_calls):
+	first = _upload(client, monkeypatch, _text(SECTIONS))
+	second = _upload(client, monkeypatch, _text(SECTIONS))
+
+	assert len(remote_calls) == 1
+	assert first["reused_sections"] == 0
+	assert second["previous_id"] == first["id"]
+	assert second["reused_sections"] == len(SECTIONS)
+	assert second["ai_summary"] == "remote summary"
+
+
+def test_revision_rebuilds_summary_from_sections(client, monkeypatch, remote_calls):
+	first = _upload(client, monkeypatch, _text(SECTIONS))
+	revised = dict(SECTIONS, PROJECTS="Document insight tool with FastAPI and section caching.")
+	second = _upload(client, monkeypatch, _text(revised))
+
+	assert len(remote_calls) == 1
+	assert second["reused_sections"] == len(SECTIONS) - 1
+	assert second["ai_summary"].startswith("✅ Document Insight Report")
+
+	diff = client.get(f"/documents/{second['id']}/diff").json()
+	assert diff["previous_id"] == first["id"]
+	assert [(s["title"], s["status"]) for s in diff["sections"]] == [
+		("EDUCATION", "unchanged"),
+		("EXPERIENCE", "unchanged"),
+		("PROJECTS", "changed"),
+	]
+	assert all(s["summary"] for s in diff["sections"])
+	assert diff["removed"] == []
+
+
+def test_unrelated_upload_with_same_name_uses_remote_summary(client, monkeypatch, remote_calls):
+	_upload(client, monkeypatch, _text(SECTIONS))
+	second = _upload(client, monkeypatch, _text({"ABSTRACT": "Something else entirely. Nothing shared."}))
+
+	assert len(remote_calls) == 2
+	assert second["reused_sections"] == 0
+	assert second["ai_summary"] == "remote summary"
+
+
+def test_diff_not_found(client, monkeypatch, remote_calls):
+	document = _upload(client, monkeypatch, _text(SECTIONS))
+
+	assert client.get("/documents/999/diff").status_code == 404
+	assert client.get(f"/documents/{document['id']}/diff", params={"against": 999}).status_code == 404
+
+
+def test_delete_removes_sections(client, monkeypatch, remote_calls):
+	document = _upload(client, monkeypatch, _text(SECTIONS))
+
+	assert client.delete(f"/documents/{document['id']}").status_code == 200
+	with database.get_db_connection() as conn:
+		count = conn.execute("SELECT COUNT(*) FROM document_sections WHERE document_id = ?", (document["id"],)).fetchone()[0]
+	assert count == 0
@@ -0,0 +1,73 @@
+from ai_service import section_fingerprint, split_fingerprinted_sections, summarize_fingerprinted_sections
+from main import classify_section_diff
+
+
+def _sentences(count, start=0):
+	return [f"Sentence number {i} talks about topic {i * 7 % 13} in detail." for i in range(start, start + count)]
+
+
+def test_fingerprint_ignores_whitespace_but_not_case():
+	assert section_fingerprint("Worked at\n  acme.") == section_fingerprint("Worked at acme.")
+	assert section_fingerprint("Worked at acme.") != section_fingerprint("Worked at ACME.")
+
+
+def test_headingless_chunks_survive_sentence_insertion():
+	sentences = _sentences(120)
+	original = split_fingerprinted_sections(" ".join(sentences))
+	revised = split_fingerprinted_sections(" ".join(sentences[:5] + ["A brand new sentence."] + sentences[5:]))
+
+	assert len(original) > 3
+	original_hashes = {fingerprint for _, _, fingerprint in original}
+	changed = [title for title, _, fingerprint in revised if fingerprint not in original_hashes]
+	assert len(changed) == 1
+
+
+def test_summarize_counts_only_previous_revision_hits():
+	body = " ".join(_sentences(6))
+	sections = [(title, content, section_fingerprint(content)) for title, content in [
+		("EXPERIENCE", body),
+		("PROJECTS", body),
+		("SKILLS", "Python. SQL. FastAPI."),
+	]]
+
+	summaries, hits = summarize_fingerprinted_sections(sections, {})
+	assert hits == 0
+	assert summaries[0] == summaries[1]
+
+	cache = {sections[2][2]: "cached skills"}
+	summaries, hits = summarize_fingerprinted_sections(sections, cache)
+	assert hits == 1
+	assert summaries[2] == "cached skills"
+	assert cache == {sections[2][2]: "cached skills"}
+
+
+def test_classify_section_diff():
+	previous = [
+		("EDUCATION", "h-edu", "edu"),
+		("SKILLS", "h-skills-old", "old skills"),
+		("HOBBIES", "h-hobbies", "hobbies"),
+	]
+	current = [
+		("EDUCATION", "h-edu", "edu"),
+		("SKILLS", "h-skills-new", "new skills"),
+		("PROJECTS", "h-projects", "projects"),
+	]
+
+	sections, removed = classify_section_diff(current, previous)
+
+	assert [(s.title, s.status) for s in sections] == [
+		("EDUCATION", "unchanged"),
+		("SKILLS", "changed"),
+		("PROJECTS", "added"),
+	]
+	assert [(s.title, s.status, s.summary) for s in removed] == [("HOBBIES", "removed", "hobbies")]
+
+
+def test_classify_section_diff_does_not_pair_generic_titles():
+	previous = [("Section 1", "h-a", "a"), ("Section 2", "h-b", "b")]
+	current = [("Section 1", "h-a", "a"), ("Section 2", "h-c", "c")]
+
+	sections, removed = classify_section_diff(current, previous)
+
+	assert [s.status for s in sections] == ["unchanged", "added"]
+	assert [(s.title, s.status) for s in removed] == [("Section 2", "removed")]